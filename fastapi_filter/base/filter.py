@@ -1,7 +1,7 @@
 from collections import defaultdict
 from collections.abc import Iterable
 from copy import deepcopy
-from typing import Any, Dict, List, Optional, Tuple, Type, Union
+from typing import Any, ClassVar, Dict, FrozenSet, List, Optional, Tuple, Type, Union
 
 from fastapi import Depends
 from fastapi.exceptions import RequestValidationError
@@ -9,7 +9,7 @@ from pydantic import BaseModel, Extra, ValidationError, create_model, fields, va
 from pydantic.fields import FieldInfo
 
 
-class BaseFilterModel(BaseModel, extra=Extra.forbid):
+class BaseFilterModel(BaseModel, extra=Extra.forbid, copy_on_model_validation="none"):
     """Abstract base filter class.
 
     Provides the interface for filtering and ordering.
@@ -43,6 +43,20 @@ class BaseFilterModel(BaseModel, extra=Extra.forbid):
         search_field_name: str = "search"
         prefix: str
 
+    _split_suffixes: ClassVar[Tuple[str, ...]] = ()
+    """Suffixes of the fields whose comma separated string value is split into a list (e.g. `__in`)."""
+
+    _split_fields: ClassVar[FrozenSet[str]] = frozenset()
+    """Names of the fields handled by `split_str`, computed once per class in `__init_subclass__`."""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._split_fields = frozenset(
+            field_name
+            for field_name in cls.__fields__
+            if field_name == cls.Constants.ordering_field_name or field_name.endswith(cls._split_suffixes)
+        )
+
     def filter(self, query):  # pragma: no cover
         ...
 
@@ -67,8 +81,10 @@ class BaseFilterModel(BaseModel, extra=Extra.forbid):
             )
 
     @validator("*", pre=True)
-    def split_str(cls, value, field):  # pragma: no cover
-        ...
+    def split_str(cls, value, field):
+        if isinstance(value, str) and field.name in cls._split_fields:
+            return list(map(field.type_, value.split(",")))
+        return value
 
     @validator("*", pre=True, allow_reuse=True, check_fields=False)
     def strip_order_by_values(cls, value, values, field):
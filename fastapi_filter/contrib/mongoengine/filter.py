@@ -1,6 +1,5 @@
 from mongoengine import QuerySet
 from mongoengine.queryset.visitor import Q
-from pydantic import validator
 
 from ...base.filter import BaseFilterModel
 
@@ -28,24 +27,17 @@ class Filter(BaseFilterModel):
         ```
     """
 
+    _split_suffixes = ("__in", "__nin")
+
     def sort(self, query: QuerySet) -> QuerySet:
         if not self.ordering_values:
             return query
         return query.order_by(*self.ordering_values)
 
-    @validator("*", pre=True)
-    def split_str(cls, value, field):
-        if (
-            field.name == cls.Constants.ordering_field_name
-            or field.name.endswith("__in")
-            or field.name.endswith("__nin")
-        ) and isinstance(value, str):
-            return [field.type_(v) for v in value.split(",")]
-        return value
-
     def filter(self, query: QuerySet) -> QuerySet:
         for field_name, value in self.filtering_fields:
-            field_value = getattr(self, field_name)
+            # Only nested filters are serialized to a dict, the other values are the attributes themselves.
+            field_value = getattr(self, field_name) if isinstance(value, dict) else value
             if isinstance(field_value, Filter):
                 if not field_value.dict(exclude_none=True, exclude_unset=True):
                     continue
@@ -1,27 +1,31 @@
 # -*- coding: utf-8 -*-
 from enum import Enum
-from typing import Union
+from typing import Any, Callable, ClassVar, Dict, Tuple, Type, Union
 
-from pydantic import validator
 from sqlalchemy import or_
 from sqlalchemy.orm import Query
+from sqlalchemy.sql import operators
 from sqlalchemy.sql.selectable import Select
 
 from ...base.filter import BaseFilterModel
 
-_orm_operator_transformer = {
-    "neq": lambda value: ("__ne__", value),
-    "gt": lambda value: ("__gt__", value),
-    "gte": lambda value: ("__ge__", value),
-    "in": lambda value: ("in_", value),
-    "isnull": lambda value: ("is_", None) if value is True else ("is_not", None),
-    "lt": lambda value: ("__lt__", value),
-    "lte": lambda value: ("__le__", value),
-    "like": lambda value: ("like", f"%{value}%"),
-    "ilike": lambda value: ("ilike", f"%{value}%"),
+_OperatorTransformer = Callable[[Any], Tuple[Callable, Any]]
+_CompiledField = Tuple[Any, _OperatorTransformer]
+"""Model attribute and operator transformer of a filtering field."""
+
+_orm_operator_transformer: Dict[str, _OperatorTransformer] = {
+    "neq": lambda value: (operators.ne, value),
+    "gt": lambda value: (operators.gt, value),
+    "gte": lambda value: (operators.ge, value),
+    "in": lambda value: (operators.in_op, value),
+    "isnull": lambda value: (operators.is_, None) if value is True else (operators.is_not, None),
+    "lt": lambda value: (operators.lt, value),
+    "lte": lambda value: (operators.le, value),
+    "like": lambda value: (operators.like_op, f"%{value}%"),
+    "ilike": lambda value: (operators.ilike_op, f"%{value}%"),
     # XXX(arthurio): Mysql excludes None values when using `in` or `not in` filters.
-    "not": lambda value: ("is_not", value),
-    "not_in": lambda value: ("not_in", value),
+    "not": lambda value: (operators.is_not, value),
+    "not_in": lambda value: (operators.not_in_op, value),
 }
 """Operators à la Django.
 
@@ -32,6 +36,17 @@ Examples:
     user_id__in
 """
 
+# Field names without an operator, e.g. `name`.
+_eq_transformer: _OperatorTransformer = lambda value: (operators.eq, value)  # noqa: E731
+
+
+def _compile_field(model: Type, field_name: str) -> _CompiledField:
+    """Resolve the model attribute and the operator transformer of a Django style filter field name."""
+    model_field_name, separator, operator = field_name.partition("__")
+    transformer = _orm_operator_transformer[operator] if separator else _eq_transformer
+
+    return getattr(model, model_field_name), transformer
+
 
 class Filter(BaseFilterModel):
     """Base filter for orm related filters.
@@ -65,37 +80,44 @@ class Filter(BaseFilterModel):
         asc = "asc"
         desc = "desc"
 
-    @validator("*", pre=True)
-    def split_str(cls, value, field):
-        if (
-            field.name == cls.Constants.ordering_field_name
-            or field.name.endswith("__in")
-            or field.name.endswith("__not_in")
-        ) and isinstance(value, str):
-            return [field.type_(v) for v in value.split(",")]
-        return value
+    _split_suffixes = ("__in", "__not_in")
+
+    _compiled_fields: ClassVar[Dict[str, _CompiledField]] = {}
+    """Model attribute and operator transformer of each filtering field, resolved on first use."""
+
+    _order_by_clauses: ClassVar[Dict[Tuple[str, str], Any]] = {}
+    """`ORDER BY` clause of each (field name, direction), built on first use.
+
+    Clause elements are immutable, so the same one can safely be used in several statements.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._compiled_fields = {}
+        cls._order_by_clauses = {}
 
     def filter(self, query: Union[Query, Select]):
         for field_name, value in self.filtering_fields:
-            field_value = getattr(self, field_name)
+            # Only nested filters are serialized to a dict, the other values are the attributes themselves.
+            field_value = getattr(self, field_name) if isinstance(value, dict) else value
             if isinstance(field_value, Filter):
                 query = field_value.filter(query)
+            elif field_name == self.Constants.search_field_name and hasattr(self.Constants, "search_model_fields"):
+                pattern = f"%{value}%"
+                search_filters = (
+                    getattr(self.Constants.model, search_field).ilike(pattern)
+                    for search_field in self.Constants.search_model_fields
+                )
+                query = query.filter(or_(*search_filters))
             else:
-                if "__" in field_name:
-                    field_name, operator = field_name.split("__")
-                    operator, value = _orm_operator_transformer[operator](value)
-                else:
-                    operator = "__eq__"
-
-                if field_name == self.Constants.search_field_name and hasattr(self.Constants, "search_model_fields"):
-
-                    def search_filter(field):
-                        return getattr(self.Constants.model, field).ilike("%" + value + "%")
+                compiled_field = self._compiled_fields.get(field_name)
+                if compiled_field is None:
+                    compiled_field = _compile_field(self.Constants.model, field_name)
+                    self._compiled_fields[field_name] = compiled_field
 
-                    query = query.filter(or_(*list(map(search_filter, self.Constants.search_model_fields))))
-                else:
-                    model_field = getattr(self.Constants.model, field_name)
-                    query = query.filter(getattr(model_field, operator)(value))
+                model_field, transformer = compiled_field
+                operator, value = transformer(value)
+                query = query.filter(operator(model_field, value))
 
         return query
 
@@ -109,8 +131,11 @@ class Filter(BaseFilterModel):
                 direction = Filter.Direction.desc
             field_name = field_name.replace("-", "").replace("+", "")
 
-            order_by_field = getattr(self.Constants.model, field_name)
+            order_by_clause = self._order_by_clauses.get((field_name, direction))
+            if order_by_clause is None:
+                order_by_clause = getattr(getattr(self.Constants.model, field_name), direction)()
+                self._order_by_clauses[(field_name, direction)] = order_by_clause
 
-            query = query.order_by(getattr(order_by_field, direction)())
+            query = query.order_by(order_by_clause)
 
         return query
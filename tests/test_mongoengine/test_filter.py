@@ -73,3 +73,22 @@ async def test_required_filter(test_client, filter_, expected_status_code):
         error_json = response.json()
         assert "detail" in error_json
         assert isinstance(error_json["detail"], list)
+
+
+def test_filtering_fields(UserFilterOrderBy):
+    user_filter = UserFilterOrderBy(name="Mr Praline", age=None, address={"city": "Nantes"}, order_by="age")
+
+    assert dict(user_filter.filtering_fields) == {"name": "Mr Praline", "address": {"city": "Nantes"}}
+
+
+@pytest.mark.parametrize(
+    "filter_,expected_count",
+    [
+        [{"address": {}}, 6],
+        [{"address": {"city": None}}, 6],
+        [{"address": {"country": "France"}}, 2],
+    ],
+)
+def test_nested_filter(User, UserFilter, users, filter_, expected_count):
+    query = UserFilter(**filter_).filter(User.objects())
+    assert query.count() == expected_count
@@ -1,7 +1,9 @@
+from typing import Optional
 from urllib.parse import urlencode
 
 import pytest
 from fastapi import status
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.future import select
 
 
@@ -83,3 +85,53 @@ async def test_required_filter(test_client, sports, filter_, expected_status_cod
         error_json = response.json()
         assert "detail" in error_json
         assert isinstance(error_json["detail"], list)
+
+
+def test_filtering_fields(UserFilterOrderBy):
+    user_filter = UserFilterOrderBy(name="Mr Praline", age=None, address={"city": "Nantes"}, order_by="age")
+
+    assert dict(user_filter.filtering_fields) == {"name": "Mr Praline", "address": {"city": "Nantes"}}
+
+
+def test_nested_filter_is_not_copied(AddressFilter, UserFilter):
+    address_filter = AddressFilter(city="Nantes")
+
+    assert UserFilter(address=address_filter).address is address_filter
+
+
+class UnsupportedExpressionError(Exception):
+    pass
+
+
+def test_model_fields_are_resolved_on_filter(Filter, User):
+    def unsupported_expression(cls):
+        raise UnsupportedExpressionError
+
+    class UserWithUnsupportedExpression:
+        unsupported = hybrid_property(lambda self: None, expr=unsupported_expression)
+
+    class UnsupportedExpressionFilter(Filter):  # type: ignore[misc, valid-type]
+        unsupported: Optional[int]
+
+        class Constants(Filter.Constants):  # type: ignore[name-defined]
+            model = UserWithUnsupportedExpression
+
+    with pytest.raises(UnsupportedExpressionError):
+        UnsupportedExpressionFilter(unsupported=1).filter(select(User))
+
+
+@pytest.mark.asyncio
+async def test_filtering_fields_override(session, Address, User, UserFilter, users):
+    class UserFilterWithCustomField(UserFilter):  # type: ignore[misc, valid-type]
+        custom: Optional[str]
+
+        @property
+        def filtering_fields(self):
+            fields = dict(super().filtering_fields)
+            fields.pop("custom", None)
+            return fields.items()
+
+    query = select(User).outerjoin(Address)
+    query = UserFilterWithCustomField(name="Mr Praline", custom="ignored").filter(query)
+    result = await session.execute(query)
+    assert len(result.scalars().unique().all()) == 1